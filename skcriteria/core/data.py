@@ -36,6 +36,39 @@ from .stats import DecisionMatrixStatsAccessor
 from ..utils import deprecated, df_temporal_header, doc_inherit
 
 
+# =============================================================================
+# OBJECTIVES CONVERSION
+# =============================================================================
+
+
+def _as_objective_array(objectives):
+    """Convert an iterable of objectives aliases into an array of \
+    ``Objective`` instances.
+
+    Numeric arrays (the common case, where every value is
+    ``Objective.MIN.value`` or ``Objective.MAX.value``) are converted in a
+    single vectorized pass. Any other kind of alias is resolved element by
+    element with ``Objective.from_alias``.
+
+    """
+    arr = np.asarray(objectives)
+    if arr.ndim != 1:
+        raise ValueError(
+            f"The objectives must be a 1D iterable. Found {arr.ndim}D"
+        )
+    if arr.dtype.kind in "iuf":
+        is_max = arr == Objective.MAX.value
+        invalid = ~(is_max | (arr == Objective.MIN.value))
+        if np.any(invalid):
+            raise ValueError(f"Invalid criteria objective {arr[invalid][0]}")
+        return np.where(is_max, Objective.MAX, Objective.MIN)
+
+    # the dtype is forced to object to avoid mixed aliases like [1, "max"]
+    # being coerced to strings
+    arr = np.asarray(objectives, dtype=object)
+    return np.array([Objective.from_alias(a) for a in arr], dtype=object)
+
+
 # =============================================================================
 # SLICERS ARRAY
 # =============================================================================
@@ -82,6 +115,13 @@ class _ACArray(np.ndarray, abc.Mapping):
         return (self[e] for e in self)
 
 
+def _as_ac_array(index, slicer):
+    """Create a read-only _ACArray with the values of a pandas index."""
+    arr = index.to_numpy(copy=True)
+    arr.flags.writeable = False
+    return _ACArray(arr, slicer)
+
+
 class _Loc:
     """Locator abstraction.
 
@@ -207,8 +247,15 @@ class DecisionMatrix:
             else pd.DataFrame(data_df, copy=True)
         )
 
-        self._objectives = np.asarray(objectives, dtype=object)
-        self._weights = np.asanyarray(weights, dtype=float)
+        self._objectives = _as_objective_array(objectives)
+        self._iobjectives = np.fromiter(
+            (o.value for o in self._objectives),
+            dtype=np.int8,
+            count=len(self._objectives),
+        )
+        # always an owned, contiguous float64 array, so the methods can send
+        # it to BLAS without any extra conversion or copy
+        self._weights = np.array(weights, dtype=np.float64, order="C")
 
         if not (
             len(self._data_df.columns)
@@ -220,6 +267,36 @@ class DecisionMatrix:
                 "number of criteria (number of columns in data_df)"
             )
 
+        self._set_ac_arrays()
+
+    def _set_ac_arrays(self):
+        # alternatives and criteria are read-only arrays, so they are built
+        # once and shared between calls (the rest of the properties return
+        # mutable pandas objects and must be rebuilt every time)
+        self._alternatives = _as_ac_array(
+            self._data_df.index, self._data_df.loc.__getitem__
+        )
+        self._criteria = _as_ac_array(
+            self._data_df.columns, self._data_df.__getitem__
+        )
+
+    def __getstate__(self):
+        """Return the state to pickle/copy, without the derived arrays.
+
+        The slicers of alternatives and criteria are bound to the internal
+        dataframe and are not preserved by numpy, so they are rebuilt in
+        ``__setstate__``.
+
+        """
+        state = self.__dict__.copy()
+        del state["_alternatives"], state["_criteria"]
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state and rebuild the alternatives and criteria."""
+        self.__dict__.update(state)
+        self._set_ac_arrays()
+
     # CUSTOM CONSTRUCTORS =====================================================
 
     @classmethod
@@ -302,26 +379,32 @@ class DecisionMatrix:
                 f"'matrix' must have 2 dimensions, found {matrix_ndim} instead"
             )
 
-        alternatives = np.asarray(
-            [f"A{idx}" for idx in range(a_number)]
+        # the default names are always strings, so we create them directly
+        # as the object Index that pandas would infer, skipping the
+        # conversion and type inference of the labels.
+        alternatives = (
+            pd.Index([f"A{idx}" for idx in range(a_number)], dtype=object)
             if alternatives is None
-            else alternatives
+            else np.asarray(alternatives)
         )
         if len(alternatives) != a_number:
             raise ValueError(f"'alternatives' must have {a_number} elements")
 
-        criteria = np.asarray(
-            [f"C{idx}" for idx in range(c_number)]
+        criteria = (
+            pd.Index([f"C{idx}" for idx in range(c_number)], dtype=object)
             if criteria is None
-            else criteria
+            else np.asarray(criteria)
         )
 
         if len(criteria) != c_number:
             raise ValueError(f"'criteria' must have {c_number} elements")
 
-        weights = np.asarray(np.ones(c_number) if weights is None else weights)
+        weights = np.ones(c_number) if weights is None else weights
 
-        data_df = pd.DataFrame(matrix, index=alternatives, columns=criteria)
+        # the constructor makes the copy of the data, so here is not needed
+        data_df = pd.DataFrame(
+            matrix, index=alternatives, columns=criteria, copy=False
+        )
 
         if dtypes is not None and len(dtypes) != c_number:
             raise ValueError(f"'dtypes' must have {c_number} elements")
@@ -344,9 +427,7 @@ class DecisionMatrix:
         ``pandas.Series``.
 
         """
-        arr = self._data_df.index.to_numpy(copy=True)
-        slicer = self._data_df.loc.__getitem__
-        return _ACArray(arr, slicer)
+        return self._alternatives
 
     @property
     def criteria(self):
@@ -356,9 +437,7 @@ class DecisionMatrix:
         ``pandas.Series``.
 
         """
-        arr = self._data_df.columns.to_numpy(copy=True)
-        slicer = self._data_df.__getitem__
-        return _ACArray(arr, slicer)
+        return self._criteria
 
     @property
     def weights(self):
@@ -375,7 +454,7 @@ class DecisionMatrix:
     def objectives(self):
         """Objectives of the criteria as ``Objective`` instances."""
         return pd.Series(
-            [Objective.from_alias(a) for a in self._objectives],
+            self._objectives,
             index=self._data_df.columns,
             name="Objectives",
             copy=True,
@@ -406,7 +485,7 @@ class DecisionMatrix:
 
         """
         return pd.Series(
-            [o.value for o in self.objectives],
+            self._iobjectives,
             dtype=np.int8,
             index=self._data_df.columns.copy(deep=True),
             copy=True,
@@ -476,6 +555,16 @@ class DecisionMatrix:
             A new decision matrix.
 
         """
+        if not kwargs:
+            # nothing to replace, so the already validated data is given
+            # directly to the constructor (which makes the deep copy of the
+            # matrix), skipping the round trip through from_mcda_data
+            return type(self)(
+                data_df=self._data_df,
+                objectives=self._objectives,
+                weights=self._weights,
+            )
+
         dmdict = self.to_dict()
         dmdict.update(kwargs)
 
@@ -512,9 +601,15 @@ class DecisionMatrix:
            A1            4    5    6
 
         """
-        data = np.vstack((self.objectives, self.weights, self.matrix))
-        index = np.hstack((["objectives", "weights"], self.alternatives))
-        df = pd.DataFrame(data, index=index, columns=self.criteria, copy=True)
+        # The objectives share the columns with the numbers, so the result
+        # is always of dtype object. The internal arrays are stacked directly
+        # to avoid creating the pandas objects of the properties first.
+        data = np.vstack(
+            (self._objectives, self._weights, self._data_df.to_numpy())
+        )
+        index = np.hstack((["objectives", "weights"], self._data_df.index))
+        columns = self._data_df.columns.to_numpy()
+        df = pd.DataFrame(data, index=index, columns=columns, copy=False)
         return df
 
     def to_dict(self):
@@ -522,13 +617,16 @@ class DecisionMatrix:
 
         All the values are represented as numpy array.
         """
+        # this is the entry point of every transformer and decision-maker,
+        # so the arrays are taken directly from the internal storage instead
+        # of building (and discarding) the pandas objects of the properties.
         return {
-            "matrix": self.matrix.to_numpy(),
-            "objectives": self.iobjectives.to_numpy(),
-            "weights": self.weights.to_numpy(),
-            "dtypes": self.dtypes.to_numpy(),
-            "alternatives": np.asarray(self.alternatives),
-            "criteria": np.asarray(self.criteria),
+            "matrix": self._data_df.to_numpy(copy=True),
+            "objectives": self._iobjectives.copy(),
+            "weights": self._weights.copy(),
+            "dtypes": self._data_df.dtypes.to_numpy(copy=True),
+            "alternatives": self._data_df.index.to_numpy(copy=True),
+            "criteria": self._data_df.columns.to_numpy(copy=True),
         }
 
     @deprecated(
@@ -577,6 +675,21 @@ class DecisionMatrix:
         """
         return len(self._data_df)
 
+    def __array__(self, dtype=None, copy=None):
+        """Return a copy of the alternatives matrix as a numpy array.
+
+        dm.__array__() <==> np.asarray(dm)
+
+        The array is always a copy, so the decision matrix can't be modified
+        through it (and ``copy=False`` is not supported).
+
+        """
+        if copy is False:
+            raise ValueError(
+                "DecisionMatrix can't be converted to an array without a copy"
+            )
+        return self._data_df.to_numpy(dtype=dtype, copy=True)
+
     def equals(self, other):
         """Return True if the decision matrix are equal.
 
@@ -648,22 +761,25 @@ class DecisionMatrix:
         :py:func:`numpy.allclose`.
 
         """
+        # compare the internal arrays directly: the objectives as int8 (a
+        # numeric comparison instead of a rich-compare of Objective objects)
+        # and without building the public pandas objects.
         return (self is other) or (
             isinstance(other, DecisionMatrix)
             and np.shape(self) == np.shape(other)
             and np.array_equal(self.criteria, other.criteria)
             and np.array_equal(self.alternatives, other.alternatives)
-            and np.array_equal(self.objectives, other.objectives)
+            and np.array_equal(self._iobjectives, other._iobjectives)
             and np.allclose(
-                self.weights,
-                other.weights,
+                self._weights,
+                other._weights,
                 rtol=rtol,
                 atol=atol,
                 equal_nan=equal_nan,
             )
             and np.allclose(
-                self.matrix,
-                other.matrix,
+                self._data_df.to_numpy(),
+                other._data_df.to_numpy(),
                 rtol=rtol,
                 atol=atol,
                 equal_nan=equal_nan,
@@ -721,28 +837,38 @@ class DecisionMatrix:
 
     # REPR ====================================================================
 
+    def _get_objectives_symbols(self):
+        """Array with the printable symbol of every criteria objective."""
+        return np.where(
+            self._iobjectives == Objective.MAX.value,
+            Objective.MAX.to_symbol(),
+            Objective.MIN.to_symbol(),
+        )
+
     def _get_cow_headers(
         self, only=None, fmt="{criteria}[{objective}{weight}]"
     ):
         """Columns names with COW (Criteria, Objective, Weight)."""
         criteria = self._data_df.columns.to_series()
-        objectives = self.objectives
+        symbols = pd.Series(
+            self._get_objectives_symbols(), index=self._data_df.columns
+        )
         weights = self.weights
 
         if only:
             mask = self._data_df.columns.isin(only)
             criteria = criteria[mask][only]
-            objectives = objectives[mask][only]
+            symbols = symbols[mask][only]
             weights = weights[mask][only]
 
-        weights = pd_fmt.format_array(weights, None)
+        # formatting the raw values is a lot faster than formatting a Series
+        # and this is executed on every repr and html repr.
+        weights = pd_fmt.format_array(weights.to_numpy(), None)
 
-        headers = []
-        for crit, obj, weight in zip(criteria, objectives, weights):
-            header = fmt.format(
-                criteria=crit, objective=obj.to_symbol(), weight=weight
-            )
-            headers.append(header)
+        headers = [
+            fmt.format(criteria=crit, objective=symbol, weight=weight)
+            for crit, symbol, weight in zip(criteria, symbols, weights)
+        ]
         return np.array(headers)
 
     def _get_axc_dimensions(self):
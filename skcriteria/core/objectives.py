@@ -83,11 +83,10 @@ class Objective(enum.Enum):
             return alias
         if isinstance(alias, str):
             alias = alias.lower()
-        if alias in cls._MAX_ALIASES.value:
-            return cls.MAX
-        if alias in cls._MIN_ALIASES.value:
-            return cls.MIN
-        raise ValueError(f"Invalid criteria objective {alias}")
+        objective = _OBJECTIVES_BY_ALIAS.get(alias)
+        if objective is None:
+            raise ValueError(f"Invalid criteria objective {alias}")
+        return objective
 
     # METHODS =================================================================
 
@@ -97,10 +96,7 @@ class Objective(enum.Enum):
 
     def to_symbol(self):
         """Return the printable symbol representation of the objective."""
-        if self.value in Objective._MIN_ALIASES.value:
-            return Objective._MIN_STR.value
-        if self.value in Objective._MAX_ALIASES.value:
-            return Objective._MAX_STR.value
+        return _SYMBOLS_BY_OBJECTIVE[self]
 
     # DEPRECATED ==============================================================
 
@@ -114,3 +110,21 @@ class Objective(enum.Enum):
     def to_string(self):
         """Return the printable representation of the objective."""
         return self.to_symbol()
+
+
+# =============================================================================
+# LOOKUPS
+# =============================================================================
+
+#: Every alias mapped to their objective. This allows to resolve an alias
+#: with a single lookup instead of checking the two sets of aliases.
+_OBJECTIVES_BY_ALIAS = {
+    **dict.fromkeys(Objective._MAX_ALIASES.value, Objective.MAX),
+    **dict.fromkeys(Objective._MIN_ALIASES.value, Objective.MIN),
+}
+
+#: The printable symbol of every objective.
+_SYMBOLS_BY_OBJECTIVE = {
+    Objective.MAX: Objective._MAX_STR.value,
+    Objective.MIN: Objective._MIN_STR.value,
+}
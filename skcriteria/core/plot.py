@@ -15,13 +15,16 @@
 # IMPORTS
 # =============================================================================
 
-import pandas as pd
+import numpy as np
 
-import seaborn as sns
+import pandas as pd
 
 from .objectives import Objective
 from ..utils import AccessorABC
 
+# seaborn (and with it matplotlib) is imported inside the plot methods, so
+# only the users that actually plot pay for its import time.
+
 
 # =============================================================================
 # PLOTTER OBJECT
@@ -58,31 +61,54 @@ class DecisionMatrixPlotter(AccessorABC):
     def __init__(self, dm):
         self._dm = dm
 
+        # filled on first access by the _criteria_labels property
+        self._criteria_labels_cache = None
+
     # PRIVATE =================================================================
     # This method are used "a lot" inside all the different plots, so we can
     # save some lines of code
-    def _get_criteria_labels(self, **kwargs):
-        kwargs.setdefault("fmt", "{criteria} {objective}")
-        labels = self._dm._get_cow_headers(**kwargs)
-        return pd.Series(labels, name="Criteria")
+    def _get_criteria_labels(self, only=None):
+        # "{criteria} {objective}" built with a vectorized concatenation,
+        # without formatting the weights as DecisionMatrix._get_cow_headers
+        criteria = self._dm.criteria
+        symbols = self._dm._get_objectives_symbols()
+        labels = pd.Series(
+            np.char.add(np.char.add(criteria.astype(str), " "), symbols),
+            index=criteria,
+        )
+        if only:
+            labels = labels[only]
+        return pd.Series(labels.to_numpy(), name="Criteria")
+
+    # The decision matrix is immutable, so the labels are built once per
+    # plotter and reused by every plot. The dataframes are copies of the
+    # whole data, so they are built on each call instead of being kept alive
+    # with the plotter (which DecisionMatrix.plot caches).
+    @property
+    def _criteria_labels(self):
+        if self._criteria_labels_cache is None:
+            self._criteria_labels_cache = self._get_criteria_labels()
+        return self._criteria_labels_cache
 
     @property
     def _ddf(self):
         # proxy to access the dataframe with the data
         ddf = self._dm.matrix
-        ddf.columns = self._get_criteria_labels()
+        ddf.columns = self._criteria_labels
         return ddf
 
     @property
     def _wdf(self):
         # proxy to access the dataframe with the weights
         wdf = self._dm.weights.to_frame()
-        wdf.index = self._get_criteria_labels()
+        wdf.index = self._criteria_labels
         return wdf
 
     # HEATMAP =================================================================
 
     def _heatmap(self, df, **kwargs):
+        import seaborn as sns
+
         ax = sns.heatmap(df, **kwargs)
         return ax
 
@@ -246,6 +272,8 @@ class DecisionMatrixPlotter(AccessorABC):
         matplotlib.axes.Axes or numpy.ndarray of them
 
         """
+        import seaborn as sns
+
         ax = sns.histplot(self._ddf, **kwargs)
         return ax
 
@@ -267,6 +295,8 @@ class DecisionMatrixPlotter(AccessorABC):
         matplotlib.axes.Axes or numpy.ndarray of them
 
         """
+        import seaborn as sns
+
         ax = sns.histplot(self._wdf.T, **kwargs)
         return ax
 
@@ -292,6 +322,8 @@ class DecisionMatrixPlotter(AccessorABC):
         matplotlib.axes.Axes or numpy.ndarray of them
 
         """
+        import seaborn as sns
+
         ax = sns.boxplot(data=self._ddf, **kwargs)
         return ax
 
@@ -315,6 +347,8 @@ class DecisionMatrixPlotter(AccessorABC):
         matplotlib.axes.Axes or numpy.ndarray of them
 
         """
+        import seaborn as sns
+
         ax = sns.boxplot(data=self._wdf, **kwargs)
         return ax
 
@@ -342,6 +376,8 @@ class DecisionMatrixPlotter(AccessorABC):
         matplotlib.axes.Axes or numpy.ndarray of them
 
         """
+        import seaborn as sns
+
         ax = sns.kdeplot(data=self._ddf, **kwargs)
         return ax
 
@@ -367,6 +403,8 @@ class DecisionMatrixPlotter(AccessorABC):
         matplotlib.axes.Axes or numpy.ndarray of them
 
         """
+        import seaborn as sns
+
         ax = sns.kdeplot(data=self._wdf, **kwargs)
         return ax
 
@@ -397,6 +435,8 @@ class DecisionMatrixPlotter(AccessorABC):
         matplotlib.axes.Axes or numpy.ndarray of them
 
         """
+        import seaborn as sns
+
         ax = sns.ecdfplot(data=self._ddf, **kwargs)
         return ax
 
@@ -425,6 +465,8 @@ class DecisionMatrixPlotter(AccessorABC):
         matplotlib.axes.Axes or numpy.ndarray of them
 
         """
+        import seaborn as sns
+
         ax = sns.ecdfplot(data=self._wdf, **kwargs)
         return ax
 
@@ -476,7 +518,6 @@ class DecisionMatrixPlotter(AccessorABC):
 
         """
         dm = self._dm
-        import numpy as np
 
         dom = dm.dominance.dominance(strict=strict)
         bt = dm.dominance.bt().to_numpy().astype(str)
@@ -559,6 +600,8 @@ class DecisionMatrixPlotter(AccessorABC):
         :cite:p:`enwiki:1110412520`
 
         """
+        import seaborn as sns
+
         # cut the dmatrix to only the necesary criteria
         sdm = self._dm[[x, y]]
 
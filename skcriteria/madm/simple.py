@@ -30,10 +30,8 @@ from ..utils import doc_inherit, rank
 
 def wsm(matrix, weights):
     """Execute weighted sum model without any validation."""
-    # calculate ranking by inner prodcut
-
-    rank_mtx = np.inner(matrix, weights)
-    score = np.squeeze(rank_mtx)
+    # calculate ranking by the matrix-vector product (a single BLAS call)
+    score = matrix @ weights
 
     return rank.rank_values(score, reverse=True), score
 
@@ -81,7 +79,7 @@ class WeightedSumModel(SKCDecisionMakerABC):
 
     @doc_inherit(SKCDecisionMakerABC._evaluate_data)
     def _evaluate_data(self, matrix, weights, objectives, **kwargs):
-        if Objective.MIN.value in objectives:
+        if np.any(objectives == Objective.MIN.value):
             raise ValueError(
                 "WeightedSumModel can't operate with minimize objective"
             )
@@ -112,10 +110,9 @@ def wpm(matrix, weights):
     # instead of multiply we sum the logarithms
     lmtx = np.log10(matrix)
 
-    # add the weights to the mtx
-    rank_mtx = np.multiply(lmtx, weights)
-
-    score = np.sum(rank_mtx, axis=1)
+    # weight and sum the logarithms in a single matrix-vector product,
+    # without the intermediate weighted matrix
+    score = lmtx @ weights
 
     return rank.rank_values(score, reverse=True), score
 
@@ -172,11 +169,15 @@ class WeightedProductModel(SKCDecisionMakerABC):
 
     @doc_inherit(SKCDecisionMakerABC._evaluate_data)
     def _evaluate_data(self, matrix, weights, objectives, **kwargs):
-        if Objective.MIN.value in objectives:
+        if np.any(objectives == Objective.MIN.value):
             raise ValueError(
                 "WeightedProductModel can't operate with minimize objective"
             )
-        if np.any(matrix <= 0):
+        # the minimum is a single pass over the matrix without allocating the
+        # boolean mask of "matrix <= 0". A NaN propagates to the minimum and
+        # hides any other value, so only then the full comparison is needed.
+        minimum = np.min(matrix) if np.size(matrix) else np.inf
+        if minimum <= 0 or (minimum != minimum and np.any(matrix <= 0)):
             raise ValueError(
                 "WeightedProductModel can't operate with values <= 0"
             )
@@ -20,8 +20,6 @@ from collections import namedtuple
 
 import numpy as np
 
-from scipy import stats
-
 
 # =============================================================================
 # RANKER
@@ -64,7 +62,11 @@ def rank_values(arr, reverse=False):
     """
     if reverse:
         arr = np.multiply(arr, -1)
-    return stats.rankdata(arr, "dense").astype(int)
+
+    # the dense ranking of every value is the position (1 based) that it
+    # takes in the sorted array of unique values
+    _, ranking = np.unique(np.ravel(arr), return_inverse=True)
+    return ranking + 1
 
 
 # =============================================================================
@@ -18,7 +18,11 @@
 # IMPORTS
 # =============================================================================
 
+import copy
+import gc
+import pickle
 import warnings
+import weakref
 
 import numpy as np
 
@@ -239,6 +243,18 @@ def test_DecisionMatrix_no_provide_cnames_and_anames(data_values):
     )
 
 
+def test_DecisionMatrix_from_mcda_data_does_not_share_matrix(data_values):
+    mtx, objectives, weights, _, _ = data_values(seed=42)
+    original = mtx.copy()
+
+    dm = data.mkdm(matrix=mtx, objectives=objectives, weights=weights)
+    mtx[:] = 0
+
+    np.testing.assert_array_equal(dm.matrix, original)
+    assert dm.alternatives.dtype == object
+    assert dm.criteria.dtype == object
+
+
 # =============================================================================
 # PROPERTIES
 # =============================================================================
@@ -283,6 +299,50 @@ def test_DecisionMatrix_dominance(decision_matrix):
     assert dm.dominance._dm is dm
 
 
+def test_DecisionMatrix_alternatives_criteria_cached(decision_matrix):
+    dm = decision_matrix(seed=42)
+
+    assert dm.alternatives is dm.alternatives
+    assert dm.criteria is dm.criteria
+
+    with pytest.raises(ValueError):
+        np.asarray(dm.alternatives)[0] = "foo"
+    with pytest.raises(ValueError):
+        np.asarray(dm.criteria)[0] = "foo"
+
+
+@pytest.mark.parametrize(
+    "clone",
+    [lambda dm: pickle.loads(pickle.dumps(dm)), copy.deepcopy, copy.copy],
+)
+def test_DecisionMatrix_alternatives_criteria_pickle_and_copy(
+    decision_matrix, clone
+):
+    dm = decision_matrix(seed=42)
+    result = clone(dm)
+
+    assert result.equals(dm)
+    for alt in dm.alternatives:
+        pd.testing.assert_series_equal(
+            result.alternatives[alt], dm.alternatives[alt]
+        )
+    for crit in dm.criteria:
+        pd.testing.assert_series_equal(
+            result.criteria[crit], dm.criteria[crit]
+        )
+
+
+def test_DecisionMatrix_alternatives_criteria_not_leak(decision_matrix):
+    dm = decision_matrix(seed=42)
+    dm.alternatives, dm.criteria
+
+    ref = weakref.ref(dm)
+    del dm
+    gc.collect()
+
+    assert ref() is None
+
+
 # =============================================================================
 # DECISION MATRIX
 # =============================================================================
@@ -302,6 +362,45 @@ def test_DecisionMatrix_copy(data_values):
 
     assert dm is not copy
     assert dm.equals(copy)
+    assert not np.shares_memory(copy._data_df.to_numpy(), mtx)
+    assert not np.shares_memory(copy._weights, dm._weights)
+
+
+def test_DecisionMatrix_copy_with_kwargs(data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    dm = data.mkdm(
+        matrix=mtx,
+        objectives=objectives,
+        weights=weights,
+        alternatives=alternatives,
+        criteria=criteria,
+    )
+    copy = dm.copy(weights=np.ones(len(criteria)))
+
+    np.testing.assert_array_equal(copy.matrix, dm.matrix)
+    np.testing.assert_array_equal(copy.iobjectives, dm.iobjectives)
+    np.testing.assert_array_equal(copy.weights, np.ones(len(criteria)))
+
+
+def test_DecisionMatrix_weights_are_contiguous_float64(data_values):
+    mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
+
+    # a strided integer view
+    weights = np.repeat(np.arange(1, len(criteria) + 1), 2)[::2]
+
+    dm = data.mkdm(
+        matrix=mtx,
+        objectives=objectives,
+        weights=weights,
+        alternatives=alternatives,
+        criteria=criteria,
+    )
+
+    assert dm._weights.dtype == np.float64
+    assert dm._weights.flags.c_contiguous
+    assert not np.shares_memory(dm._weights, weights)
+    np.testing.assert_array_equal(dm._weights, weights)
 
 
 def test_DecisionMatrix_to_dataframe(data_values):
@@ -353,6 +452,18 @@ def test_DecisionMatrix_to_dict(data_values):
     assert np.all(cmp.values())
 
 
+def test_DecisionMatrix_to_dict_iobjectives_are_a_copy(decision_matrix):
+    dm = decision_matrix(seed=42)
+
+    objectives = dm.to_dict()["objectives"]
+    assert objectives.dtype == np.int8
+
+    objectives[:] = 0
+    np.testing.assert_array_equal(
+        dm.iobjectives, [o.value for o in dm.objectives]
+    )
+
+
 def test_DecisionMatrix_describe(data_values):
 
     mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
@@ -454,6 +565,22 @@ def test_DecisionMatrix_len_vs_shape_ncriteria(decision_matrix):
     assert (len(dm), len(dm.criteria)) == np.shape(dm) == dm.shape
 
 
+def test_DecisionMatrix__array__(decision_matrix):
+    dm = decision_matrix(seed=42)
+
+    np.testing.assert_array_equal(np.asarray(dm), dm.matrix.to_numpy())
+    assert np.asarray(dm, dtype=np.float32).dtype == np.float32
+
+    # the array is a copy, writing on it doesn't change the decision matrix
+    original = dm.matrix.to_numpy()
+    arr = np.asarray(dm)
+    arr[0, 0] = 999
+    np.testing.assert_array_equal(dm.matrix.to_numpy(), original)
+
+    with pytest.raises(ValueError):
+        dm.__array__(copy=False)
+
+
 def test_DecisionMatrix_self_eq(data_values):
     mtx, objectives, weights, alternatives, criteria = data_values(seed=42)
 
@@ -493,6 +620,21 @@ def test_DecisionMatrix_self_ne(data_values):
     assert not dm.equals(other)
 
 
+def test_DecisionMatrix_ne_only_objectives():
+    dm = data.mkdm(
+        matrix=[[1, 2, 3], [4, 5, 6]],
+        objectives=[min, max, min],
+    )
+    other = data.mkdm(
+        matrix=[[1, 2, 3], [4, 5, 6]],
+        objectives=[min, max, max],
+    )
+
+    assert dm.equals(dm.copy())
+    assert not dm.equals(other)
+    assert not other.equals(dm)
+
+
 # =============================================================================
 # SLICES
 # =============================================================================
@@ -712,6 +854,35 @@ def test_DecisionMatrix_invalid_objective(data_values):
         )
 
 
+def test_DecisionMatrix_invalid_numeric_objective(data_values):
+    mtx, _, weights, alternatives, criteria = data_values(seed=42)
+    objectives = np.ones(len(criteria), dtype=int)
+    objectives[0] = 2
+    with pytest.raises(ValueError, match="Invalid criteria objective 2"):
+        data.mkdm(
+            matrix=mtx,
+            objectives=objectives,
+            weights=weights,
+            alternatives=alternatives,
+            criteria=criteria,
+        )
+
+
+@pytest.mark.parametrize("objectives", [[[1, 1, 1]], [[1], [1], [1]], 1])
+def test_DecisionMatrix_objectives_not_1D(objectives):
+    with pytest.raises(ValueError, match="must be a 1D iterable"):
+        data.mkdm(matrix=[[1, 2, 3], [4, 5, 6]], objectives=objectives)
+
+
+def test_DecisionMatrix_mixed_objective_aliases():
+    dm = data.mkdm(
+        matrix=[[1, 2, 3], [4, 5, 6]],
+        objectives=[1, "min", -1.0],
+    )
+    expected = [data.Objective.MAX, data.Objective.MIN, data.Objective.MIN]
+    assert np.all(dm.objectives.to_numpy() == expected)
+
+
 def test_DecisionMatrix_weight_no_float(data_values):
     mtx, objectives, _, alternatives, criteria = data_values(seed=42)
     weights = ["hola"]
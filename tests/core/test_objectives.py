@@ -18,6 +18,8 @@
 # IMPORTS
 # =============================================================================
 
+import numpy as np
+
 import pytest
 
 from skcriteria.core import objectives
@@ -38,6 +40,20 @@ def test_Objective_from_alias():
         objectives.Objective.from_alias("no anda")
 
 
+def test_Objective_from_alias_case_and_numpy_scalars():
+    assert objectives.Objective.from_alias("MaX") is objectives.Objective.MAX
+    assert objectives.Objective.from_alias("MIN") is objectives.Objective.MIN
+    assert (
+        objectives.Objective.from_alias(np.int8(1)) is objectives.Objective.MAX
+    )
+    assert (
+        objectives.Objective.from_alias(np.float64(-1))
+        is objectives.Objective.MIN
+    )
+    with pytest.raises(ValueError):
+        objectives.Objective.from_alias(2)
+
+
 def test_Objective_str():
     assert str(objectives.Objective.MAX) == objectives.Objective.MAX.name
     assert str(objectives.Objective.MIN) == objectives.Objective.MIN.name
@@ -34,14 +34,13 @@ from skcriteria.core import mkdm, plot
 
 
 # =============================================================================
-# HEATMAP
+# FIXTURES
 # =============================================================================
 
 
-@pytest.mark.slow
-@check_figures_equal()
-def test_DecisionMatrixPlotter_heatmap(decision_matrix, fig_test, fig_ref):
-    dm = decision_matrix(
+@pytest.fixture(scope="module")
+def small_seeded_dm(decision_matrix):
+    return decision_matrix(
         seed=42,
         min_alternatives=3,
         max_alternatives=3,
@@ -49,6 +48,59 @@ def test_DecisionMatrixPlotter_heatmap(decision_matrix, fig_test, fig_ref):
         max_criteria=3,
     )
 
+
+@pytest.fixture(scope="module")
+def small_seeded_labels(small_seeded_dm):
+    # the "{criteria} {objective}" labels used by the plots
+    dm = small_seeded_dm
+    symbols = [o.to_symbol() for o in dm.objectives]
+    labels = np.char.add(np.char.add(dm.criteria.astype(str), " "), symbols)
+    return labels.tolist()
+
+
+@pytest.fixture(scope="module")
+def dominance_annot(small_seeded_dm):
+    # the annotations don't depend on the strict parameter
+    bt = small_seeded_dm.dominance.bt().to_numpy().astype(str)
+    eq = small_seeded_dm.dominance.eq().to_numpy().astype(str)
+
+    annot = ""
+    for elem in [r"$\succ", bt, "$/$=", eq, "$"]:
+        annot = np.char.add(annot, elem)
+    return annot
+
+
+# =============================================================================
+# PRIVATE
+# =============================================================================
+
+
+def test_DecisionMatrixPlotter_cached_labels(small_seeded_dm):
+    dm = small_seeded_dm
+
+    plotter = plot.DecisionMatrixPlotter(dm=dm)
+
+    assert plotter._criteria_labels is plotter._criteria_labels
+
+    # the dataframes are not retained by the plotter
+    assert plotter._ddf is not plotter._ddf
+    assert plotter._wdf is not plotter._wdf
+    assert plotter._ddf.columns.equals(pd.Index(plotter._criteria_labels))
+    assert plotter._wdf.index.equals(pd.Index(plotter._criteria_labels))
+
+
+# =============================================================================
+# HEATMAP
+# =============================================================================
+
+
+@pytest.mark.slow
+@check_figures_equal()
+def test_DecisionMatrixPlotter_heatmap(
+    small_seeded_dm, small_seeded_labels, fig_test, fig_ref
+):
+    dm = small_seeded_dm
+
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
     test_ax = fig_test.subplots()
@@ -56,9 +108,7 @@ def test_DecisionMatrixPlotter_heatmap(decision_matrix, fig_test, fig_ref):
 
     # EXPECTED
     df = dm.matrix
-    df.columns = [
-        f"{c} {o.to_symbol()}" for c, o in zip(dm.criteria, dm.objectives)
-    ]
+    df.columns = small_seeded_labels
     df.columns.name = "Criteria"
 
     exp_ax = fig_ref.subplots()
@@ -67,14 +117,10 @@ def test_DecisionMatrixPlotter_heatmap(decision_matrix, fig_test, fig_ref):
 
 @pytest.mark.slow
 @check_figures_equal()
-def test_DecisionMatrixPlotter_wheatmap(decision_matrix, fig_test, fig_ref):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+def test_DecisionMatrixPlotter_wheatmap(
+    small_seeded_dm, small_seeded_labels, fig_test, fig_ref
+):
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
@@ -83,9 +129,7 @@ def test_DecisionMatrixPlotter_wheatmap(decision_matrix, fig_test, fig_ref):
 
     # EXPECTED
     df = dm.weights.to_frame().T
-    df.columns = [
-        f"{c} {o.to_symbol()}" for c, o in zip(dm.criteria, dm.objectives)
-    ]
+    df.columns = small_seeded_labels
     df.columns.name = "Criteria"
 
     exp_ax = fig_ref.subplots()
@@ -95,15 +139,9 @@ def test_DecisionMatrixPlotter_wheatmap(decision_matrix, fig_test, fig_ref):
 @pytest.mark.slow
 @check_figures_equal()
 def test_DecisionMatrixPlotter_wheatmap_default_axis(
-    decision_matrix, fig_test, fig_ref
+    small_seeded_dm, small_seeded_labels, fig_test, fig_ref
 ):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
@@ -113,9 +151,7 @@ def test_DecisionMatrixPlotter_wheatmap_default_axis(
 
     # EXPECTED
     df = dm.weights.to_frame().T
-    df.columns = [
-        f"{c} {o.to_symbol()}" for c, o in zip(dm.criteria, dm.objectives)
-    ]
+    df.columns = small_seeded_labels
     df.columns.name = "Criteria"
 
     exp_ax = fig_ref.subplots()
@@ -132,14 +168,10 @@ def test_DecisionMatrixPlotter_wheatmap_default_axis(
 
 @pytest.mark.slow
 @check_figures_equal()
-def test_DecisionMatrixPlotter_bar(decision_matrix, fig_test, fig_ref):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+def test_DecisionMatrixPlotter_bar(
+    small_seeded_dm, small_seeded_labels, fig_test, fig_ref
+):
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
@@ -148,9 +180,7 @@ def test_DecisionMatrixPlotter_bar(decision_matrix, fig_test, fig_ref):
 
     # EXPECTED
     df = dm.matrix
-    df.columns = [
-        f"{c} {o.to_symbol()}" for c, o in zip(dm.criteria, dm.objectives)
-    ]
+    df.columns = small_seeded_labels
     df.columns.name = "Criteria"
 
     exp_ax = fig_ref.subplots()
@@ -159,14 +189,10 @@ def test_DecisionMatrixPlotter_bar(decision_matrix, fig_test, fig_ref):
 
 @pytest.mark.slow
 @check_figures_equal()
-def test_DecisionMatrixPlotter_wbar(decision_matrix, fig_test, fig_ref):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+def test_DecisionMatrixPlotter_wbar(
+    small_seeded_dm, small_seeded_labels, fig_test, fig_ref
+):
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
@@ -175,9 +201,7 @@ def test_DecisionMatrixPlotter_wbar(decision_matrix, fig_test, fig_ref):
 
     # EXPECTED
     df = dm.weights.to_frame().T
-    df.columns = [
-        f"{c} {o.to_symbol()}" for c, o in zip(dm.criteria, dm.objectives)
-    ]
+    df.columns = small_seeded_labels
     df.columns.name = "Criteria"
 
     exp_ax = fig_ref.subplots()
@@ -191,14 +215,10 @@ def test_DecisionMatrixPlotter_wbar(decision_matrix, fig_test, fig_ref):
 
 @pytest.mark.slow
 @check_figures_equal()
-def test_DecisionMatrixPlotter_barh(decision_matrix, fig_test, fig_ref):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+def test_DecisionMatrixPlotter_barh(
+    small_seeded_dm, small_seeded_labels, fig_test, fig_ref
+):
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
@@ -207,9 +227,7 @@ def test_DecisionMatrixPlotter_barh(decision_matrix, fig_test, fig_ref):
 
     # EXPECTED
     df = dm.matrix
-    df.columns = [
-        f"{c} {o.to_symbol()}" for c, o in zip(dm.criteria, dm.objectives)
-    ]
+    df.columns = small_seeded_labels
     df.columns.name = "Criteria"
 
     exp_ax = fig_ref.subplots()
@@ -218,14 +236,10 @@ def test_DecisionMatrixPlotter_barh(decision_matrix, fig_test, fig_ref):
 
 @pytest.mark.slow
 @check_figures_equal()
-def test_DecisionMatrixPlotter_wbarh(decision_matrix, fig_test, fig_ref):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+def test_DecisionMatrixPlotter_wbarh(
+    small_seeded_dm, small_seeded_labels, fig_test, fig_ref
+):
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
@@ -234,9 +248,7 @@ def test_DecisionMatrixPlotter_wbarh(decision_matrix, fig_test, fig_ref):
 
     # EXPECTED
     df = dm.weights.to_frame().T
-    df.columns = [
-        f"{c} {o.to_symbol()}" for c, o in zip(dm.criteria, dm.objectives)
-    ]
+    df.columns = small_seeded_labels
     df.columns.name = "Criteria"
 
     exp_ax = fig_ref.subplots()
@@ -250,14 +262,10 @@ def test_DecisionMatrixPlotter_wbarh(decision_matrix, fig_test, fig_ref):
 
 @pytest.mark.slow
 @check_figures_equal()
-def test_DecisionMatrixPlotter_hist(decision_matrix, fig_test, fig_ref):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+def test_DecisionMatrixPlotter_hist(
+    small_seeded_dm, small_seeded_labels, fig_test, fig_ref
+):
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
@@ -266,9 +274,7 @@ def test_DecisionMatrixPlotter_hist(decision_matrix, fig_test, fig_ref):
 
     # EXPECTED
     df = dm.matrix
-    df.columns = [
-        f"{c} {o.to_symbol()}" for c, o in zip(dm.criteria, dm.objectives)
-    ]
+    df.columns = small_seeded_labels
     df.columns.name = "Criteria"
 
     exp_ax = fig_ref.subplots()
@@ -277,14 +283,10 @@ def test_DecisionMatrixPlotter_hist(decision_matrix, fig_test, fig_ref):
 
 @pytest.mark.slow
 @check_figures_equal()
-def test_DecisionMatrixPlotter_whist(decision_matrix, fig_test, fig_ref):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+def test_DecisionMatrixPlotter_whist(
+    small_seeded_dm, small_seeded_labels, fig_test, fig_ref
+):
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
@@ -293,9 +295,7 @@ def test_DecisionMatrixPlotter_whist(decision_matrix, fig_test, fig_ref):
 
     # EXPECTED
     df = dm.weights.to_frame().T
-    df.columns = [
-        f"{c} {o.to_symbol()}" for c, o in zip(dm.criteria, dm.objectives)
-    ]
+    df.columns = small_seeded_labels
     df.columns.name = "Criteria"
 
     exp_ax = fig_ref.subplots()
@@ -310,14 +310,10 @@ def test_DecisionMatrixPlotter_whist(decision_matrix, fig_test, fig_ref):
 @pytest.mark.slow
 @pytest.mark.parametrize("orient", ["v", "h"])
 @check_figures_equal()
-def test_DecisionMatrixPlotter_box(decision_matrix, orient, fig_test, fig_ref):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+def test_DecisionMatrixPlotter_box(
+    small_seeded_dm, small_seeded_labels, orient, fig_test, fig_ref
+):
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
@@ -326,9 +322,7 @@ def test_DecisionMatrixPlotter_box(decision_matrix, orient, fig_test, fig_ref):
 
     # EXPECTED
     df = dm.matrix
-    df.columns = [
-        f"{c} {o.to_symbol()}" for c, o in zip(dm.criteria, dm.objectives)
-    ]
+    df.columns = small_seeded_labels
     df.columns.name = "Criteria"
 
     exp_ax = fig_ref.subplots()
@@ -337,14 +331,8 @@ def test_DecisionMatrixPlotter_box(decision_matrix, orient, fig_test, fig_ref):
 
 @pytest.mark.slow
 @check_figures_equal()
-def test_DecisionMatrixPlotter_wbox(decision_matrix, fig_test, fig_ref):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+def test_DecisionMatrixPlotter_wbox(small_seeded_dm, fig_test, fig_ref):
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
@@ -363,14 +351,10 @@ def test_DecisionMatrixPlotter_wbox(decision_matrix, fig_test, fig_ref):
 # =============================================================================
 @pytest.mark.slow
 @check_figures_equal()
-def test_DecisionMatrixPlotter_kde(decision_matrix, fig_test, fig_ref):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+def test_DecisionMatrixPlotter_kde(
+    small_seeded_dm, small_seeded_labels, fig_test, fig_ref
+):
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
@@ -379,9 +363,7 @@ def test_DecisionMatrixPlotter_kde(decision_matrix, fig_test, fig_ref):
 
     # EXPECTED
     df = dm.matrix
-    df.columns = [
-        f"{c} {o.to_symbol()}" for c, o in zip(dm.criteria, dm.objectives)
-    ]
+    df.columns = small_seeded_labels
     df.columns.name = "Criteria"
 
     exp_ax = fig_ref.subplots()
@@ -390,14 +372,8 @@ def test_DecisionMatrixPlotter_kde(decision_matrix, fig_test, fig_ref):
 
 @pytest.mark.slow
 @check_figures_equal()
-def test_DecisionMatrixPlotter_wkde(decision_matrix, fig_test, fig_ref):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+def test_DecisionMatrixPlotter_wkde(small_seeded_dm, fig_test, fig_ref):
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
@@ -418,14 +394,10 @@ def test_DecisionMatrixPlotter_wkde(decision_matrix, fig_test, fig_ref):
 
 @pytest.mark.slow
 @check_figures_equal()
-def test_DecisionMatrixPlotter_ogive(decision_matrix, fig_test, fig_ref):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+def test_DecisionMatrixPlotter_ogive(
+    small_seeded_dm, small_seeded_labels, fig_test, fig_ref
+):
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
@@ -434,9 +406,7 @@ def test_DecisionMatrixPlotter_ogive(decision_matrix, fig_test, fig_ref):
 
     # EXPECTED
     df = dm.matrix
-    df.columns = [
-        f"{c} {o.to_symbol()}" for c, o in zip(dm.criteria, dm.objectives)
-    ]
+    df.columns = small_seeded_labels
     df.columns.name = "Criteria"
 
     exp_ax = fig_ref.subplots()
@@ -445,14 +415,8 @@ def test_DecisionMatrixPlotter_ogive(decision_matrix, fig_test, fig_ref):
 
 @pytest.mark.slow
 @check_figures_equal()
-def test_DecisionMatrixPlotter_wogive(decision_matrix, fig_test, fig_ref):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+def test_DecisionMatrixPlotter_wogive(small_seeded_dm, fig_test, fig_ref):
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
@@ -473,14 +437,10 @@ def test_DecisionMatrixPlotter_wogive(decision_matrix, fig_test, fig_ref):
 
 @pytest.mark.slow
 @check_figures_equal()
-def test_DecisionMatrixPlotter_area(decision_matrix, fig_test, fig_ref):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+def test_DecisionMatrixPlotter_area(
+    small_seeded_dm, small_seeded_labels, fig_test, fig_ref
+):
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
@@ -489,9 +449,7 @@ def test_DecisionMatrixPlotter_area(decision_matrix, fig_test, fig_ref):
 
     # EXPECTED
     df = dm.matrix
-    df.columns = [
-        f"{c} {o.to_symbol()}" for c, o in zip(dm.criteria, dm.objectives)
-    ]
+    df.columns = small_seeded_labels
     df.columns.name = "Criteria"
 
     exp_ax = fig_ref.subplots()
@@ -504,36 +462,25 @@ def test_DecisionMatrixPlotter_area(decision_matrix, fig_test, fig_ref):
 
 
 @pytest.mark.slow
-@pytest.mark.parametrize("strict", [True, False])
 @check_figures_equal()
 def test_DecisionMatrixPlotter_dominance(
-    decision_matrix, fig_test, fig_ref, strict
+    small_seeded_dm, dominance_annot, fig_test, fig_ref
 ):
-    dm = decision_matrix(
-        seed=42,
-        min_alternatives=3,
-        max_alternatives=3,
-        min_criteria=3,
-        max_criteria=3,
-    )
+    dm = small_seeded_dm
 
     plotter = plot.DecisionMatrixPlotter(dm=dm)
 
-    test_ax = fig_test.subplots()
-    plotter.dominance(strict=strict, ax=test_ax)
-
-    # EXPECTED
-    exp_ax = fig_ref.subplots()
+    # both strict variants are drawn side by side, so a single pair of
+    # figures is rendered and compared
+    test_axs = fig_test.subplots(1, 2)
+    exp_axs = fig_ref.subplots(1, 2)
 
-    dom = dm.dominance.dominance(strict=strict)
-    bt = dm.dominance.bt().to_numpy().astype(str)
-    eq = dm.dominance.eq().to_numpy().astype(str)
-
-    annot = ""
-    for elem in [r"$\succ", bt, "$/$=", eq, "$"]:
-        annot = np.char.add(annot, elem)
+    for strict, test_ax, exp_ax in zip((True, False), test_axs, exp_axs):
+        plotter.dominance(strict=strict, ax=test_ax)
 
-    sns.heatmap(dom, ax=exp_ax, annot=annot, fmt="", cbar=False)
+        # EXPECTED
+        dom = dm.dominance.dominance(strict=strict)
+        sns.heatmap(dom, ax=exp_ax, annot=dominance_annot, fmt="", cbar=False)
 
 
 # =============================================================================
@@ -32,167 +32,152 @@ from skcriteria.preprocessing.scalers import VectorScaler
 
 
 # =============================================================================
-# RATIO
+# CONSTANTS
 # =============================================================================
 
+# Data From:
+#     KRACKA, M; BRAUERS, W. K. M.; ZAVADSKAS, E. K. Ranking
+#     Heating Losses in a Building by Applying the MULTIMOORA . -
+#     ISSN 1392 - 2785 Inz
+
+KRACKA2010_MATRIX = np.array(
+    [
+        [33.95, 23.78, 11.45, 39.97, 29.44, 167.10, 3.852],
+        [38.9, 4.17, 6.32, 0.01, 4.29, 132.52, 25.184],
+        [37.59, 9.36, 8.23, 4.35, 10.22, 136.71, 10.845],
+        [30.44, 37.59, 13.91, 74.08, 45.10, 198.34, 2.186],
+        [36.21, 14.79, 9.17, 17.77, 17.06, 148.3, 6.610],
+        [37.8, 8.55, 7.97, 2.35, 9.25, 134.83, 11.935],
+    ],
+    dtype=float,
+)
 
-def test_RatioMOORA_kracka2010ranking():
-    """
-    Data From:
-        KRACKA, M; BRAUERS, W. K. M.; ZAVADSKAS, E. K. Ranking
-        Heating Losses in a Building by Applying the MULTIMOORA . -
-        ISSN 1392 - 2785 Inz
-    """
-    dm = skcriteria.mkdm(
-        matrix=[
-            [33.95, 23.78, 11.45, 39.97, 29.44, 167.10, 3.852],
-            [38.9, 4.17, 6.32, 0.01, 4.29, 132.52, 25.184],
-            [37.59, 9.36, 8.23, 4.35, 10.22, 136.71, 10.845],
-            [30.44, 37.59, 13.91, 74.08, 45.10, 198.34, 2.186],
-            [36.21, 14.79, 9.17, 17.77, 17.06, 148.3, 6.610],
-            [37.8, 8.55, 7.97, 2.35, 9.25, 134.83, 11.935],
-        ],
-        objectives=[min, min, min, min, max, min, max],
-        alternatives=["A1", "A2", "A3", "A4", "A5", "A6"],
-        criteria=["x1", "x2", "x3", "x4", "x5", "x6", "x7"],
-    )
+KRACKA2010_OBJECTIVES = [min, min, min, min, max, min, max]
 
-    expected = RankResult(
-        "RatioMOORA",
-        ["A1", "A2", "A3", "A4", "A5", "A6"],
-        [5, 1, 3, 6, 4, 2],
-        {
-            "score": [
-                -1.62447867,
-                -0.25233889,
-                -0.84635037,
-                -2.23363519,
-                -1.18698242,
-                -0.77456208,
-            ],
-        },
-    )
+KRACKA2010_ALTERNATIVES = ["A1", "A2", "A3", "A4", "A5", "A6"]
 
-    transformer = VectorScaler(target="matrix")
-    dm = transformer.transform(dm)
+KRACKA2010_CRITERIA = ["x1", "x2", "x3", "x4", "x5", "x6", "x7"]
 
-    ranker = RatioMOORA()
-    result = ranker.evaluate(dm)
+KRACKA2010_RATIO_SCORE = np.array(
+    [
+        -1.62447867,
+        -0.25233889,
+        -0.84635037,
+        -2.23363519,
+        -1.18698242,
+        -0.77456208,
+    ]
+)
 
-    assert result.values_equals(expected)
-    assert result.method == expected.method
-    assert np.allclose(result.e_.score, expected.e_.score)
+KRACKA2010_REFPOINT_SCORE = np.array(
+    [0.68934931, 0.69986697, 0.59817104, 0.85955696, 0.6002238, 0.61480595]
+)
+
+KRACKA2010_REFERENCE_POINT = np.array(
+    [
+        0.34587742,
+        0.08556044,
+        0.26245184,
+        0.00011605,
+        0.77343790,
+        0.34960423,
+        0.81382773,
+    ]
+)
+
+KRACKA2010_FMF_SCORE = np.log(
+    [3.4343, 148689.356, 120.3441, 0.7882, 16.2917, 252.9155]
+)
 
 
 # =============================================================================
-# REFPOINT
+# FIXTURES
 # =============================================================================
 
 
-def test_ReferencePointMOORA_kracka2010ranking():
-    """
-    Data From:
-        KRACKA, M; BRAUERS, W. K. M.; ZAVADSKAS, E. K. Ranking
-        Heating Losses in a Building by Applying the MULTIMOORA . -
-        ISSN 1392 - 2785 Inz
-    """
+@pytest.fixture(scope="module")
+def kracka2010_dm():
+    """Vector scaled decision matrix shared by the kracka2010 tests."""
     dm = skcriteria.mkdm(
-        matrix=[
-            [33.95, 23.78, 11.45, 39.97, 29.44, 167.10, 3.852],
-            [38.9, 4.17, 6.32, 0.01, 4.29, 132.52, 25.184],
-            [37.59, 9.36, 8.23, 4.35, 10.22, 136.71, 10.845],
-            [30.44, 37.59, 13.91, 74.08, 45.10, 198.34, 2.186],
-            [36.21, 14.79, 9.17, 17.77, 17.06, 148.3, 6.610],
-            [37.8, 8.55, 7.97, 2.35, 9.25, 134.83, 11.935],
-        ],
-        objectives=[min, min, min, min, max, min, max],
-        alternatives=["A1", "A2", "A3", "A4", "A5", "A6"],
-        criteria=["x1", "x2", "x3", "x4", "x5", "x6", "x7"],
-    )
-
-    expected = RankResult(
-        "ReferencePointMOORA",
-        ["A1", "A2", "A3", "A4", "A5", "A6"],
-        [4, 5, 1, 6, 2, 3],
-        {
-            "score": [
-                0.68934931,
-                0.69986697,
-                0.59817104,
-                0.85955696,
-                0.6002238,
-                0.61480595,
-            ],
-            "reference_point": [
-                0.34587742,
-                0.08556044,
-                0.26245184,
-                0.00011605,
-                0.77343790,
-                0.34960423,
-                0.81382773,
-            ],
-        },
+        matrix=KRACKA2010_MATRIX,
+        objectives=KRACKA2010_OBJECTIVES,
+        alternatives=KRACKA2010_ALTERNATIVES,
+        criteria=KRACKA2010_CRITERIA,
     )
 
     transformer = VectorScaler(target="matrix")
-    dm = transformer.transform(dm)
+    return transformer.transform(dm)
 
-    ranker = ReferencePointMOORA()
-    result = ranker.evaluate(dm)
 
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def _assert_rank_equal(result, expected, atol=1e-8):
+    """Compare the ranking, the method and all the extra values."""
     assert result.values_equals(expected)
     assert result.method == expected.method
-    assert np.allclose(result.e_.score, expected.e_.score)
-    assert np.allclose(result.e_.reference_point, expected.e_.reference_point)
+    for key, value in expected.e_.items():
+        np.testing.assert_allclose(
+            result.e_[key], value, rtol=1e-5, atol=atol, err_msg=key
+        )
 
 
 # =============================================================================
-# FMF
+# RATIO, REFPOINT AND FMF
 # =============================================================================
 
 
-def test_FullMultiplicativeForm_kracka2010ranking():
-    """
-    Data From:
-        KRACKA, M; BRAUERS, W. K. M.; ZAVADSKAS, E. K. Ranking
-        Heating Losses in a Building by Applying the MULTIMOORA . -
-        ISSN 1392 - 2785 Inz
-    """
-    dm = skcriteria.mkdm(
-        matrix=[
-            [33.95, 23.78, 11.45, 39.97, 29.44, 167.10, 3.852],
-            [38.9, 4.17, 6.32, 0.01, 4.29, 132.52, 25.184],
-            [37.59, 9.36, 8.23, 4.35, 10.22, 136.71, 10.845],
-            [30.44, 37.59, 13.91, 74.08, 45.10, 198.34, 2.186],
-            [36.21, 14.79, 9.17, 17.77, 17.06, 148.3, 6.610],
-            [37.8, 8.55, 7.97, 2.35, 9.25, 134.83, 11.935],
-        ],
-        objectives=[min, min, min, min, max, min, max],
-        alternatives=["A1", "A2", "A3", "A4", "A5", "A6"],
-        criteria=["x1", "x2", "x3", "x4", "x5", "x6", "x7"],
-    )
-
+@pytest.mark.parametrize(
+    "ranker_cls, values, extra, atol",
+    [
+        (
+            RatioMOORA,
+            [5, 1, 3, 6, 4, 2],
+            {
+                "score": KRACKA2010_RATIO_SCORE,
+            },
+            1e-8,
+        ),
+        (
+            ReferencePointMOORA,
+            [4, 5, 1, 6, 2, 3],
+            {
+                "score": KRACKA2010_REFPOINT_SCORE,
+                "reference_point": KRACKA2010_REFERENCE_POINT,
+            },
+            1e-8,
+        ),
+        (
+            FullMultiplicativeForm,
+            [5, 1, 3, 6, 4, 2],
+            {
+                "score": KRACKA2010_FMF_SCORE,
+            },
+            1e-4,
+        ),
+    ],
+)
+def test_MOORA_kracka2010ranking(
+    kracka2010_dm, ranker_cls, values, extra, atol
+):
     expected = RankResult(
-        "FullMultiplicativeForm",
-        ["A1", "A2", "A3", "A4", "A5", "A6"],
-        [5, 1, 3, 6, 4, 2],
-        {
-            "score": np.log(
-                [3.4343, 148689.356, 120.3441, 0.7882, 16.2917, 252.9155]
-            ),
-        },
+        ranker_cls.__name__,
+        KRACKA2010_ALTERNATIVES,
+        values,
+        extra,
     )
 
-    transformer = VectorScaler(target="matrix")
-    dm = transformer.transform(dm)
+    ranker = ranker_cls()
+    result = ranker.evaluate(kracka2010_dm)
 
-    ranker = FullMultiplicativeForm()
-    result = ranker.evaluate(dm)
+    _assert_rank_equal(result, expected, atol=atol)
 
-    assert result.values_equals(expected)
-    assert result.method == expected.method
-    assert np.allclose(result.e_.score, expected.e_.score, atol=1e-4)
+
+# =============================================================================
+# FMF
+# =============================================================================
 
 
 def test_FullMultiplicativeForm_only_minimize():
@@ -220,9 +205,7 @@ def test_FullMultiplicativeForm_only_minimize():
     ranker = FullMultiplicativeForm()
     result = ranker.evaluate(dm)
 
-    assert result.values_equals(expected)
-    assert result.method == expected.method
-    assert np.allclose(result.e_.score, expected.e_.score, atol=1e-4)
+    _assert_rank_equal(result, expected, atol=1e-4)
 
 
 def test_FullMultiplicativeForm_only_maximize():
@@ -250,10 +233,7 @@ def test_FullMultiplicativeForm_only_maximize():
     ranker = FullMultiplicativeForm()
     result = ranker.evaluate(dm)
 
-    assert result.values_equals(expected)
-    assert result.method == expected.method
-
-    assert np.allclose(result.e_.score, expected.e_.score, atol=1e-4)
+    _assert_rank_equal(result, expected, atol=1e-4)
 
 
 def test_FullMultiplicativeForm_with0_fail():
@@ -263,37 +243,17 @@ def test_FullMultiplicativeForm_with0_fail():
     )
 
     ranker = FullMultiplicativeForm()
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="values <= 0"):
         ranker.evaluate(dm)
 
 
 # =============================================================================
 # MULTIMOORA
 # =============================================================================
-def test_MultiMOORA_kracka2010ranking():
-    """
-    Data From:
-        KRACKA, M; BRAUERS, W. K. M.; ZAVADSKAS, E. K. Ranking
-        Heating Losses in a Building by Applying the MULTIMOORA . -
-        ISSN 1392 - 2785 Inz
-    """
-    dm = skcriteria.mkdm(
-        matrix=[
-            [33.95, 23.78, 11.45, 39.97, 29.44, 167.10, 3.852],
-            [38.9, 4.17, 6.32, 0.01, 4.29, 132.52, 25.184],
-            [37.59, 9.36, 8.23, 4.35, 10.22, 136.71, 10.845],
-            [30.44, 37.59, 13.91, 74.08, 45.10, 198.34, 2.186],
-            [36.21, 14.79, 9.17, 17.77, 17.06, 148.3, 6.610],
-            [37.8, 8.55, 7.97, 2.35, 9.25, 134.83, 11.935],
-        ],
-        objectives=[min, min, min, min, max, min, max],
-        alternatives=["A1", "A2", "A3", "A4", "A5", "A6"],
-        criteria=["x1", "x2", "x3", "x4", "x5", "x6", "x7"],
-    )
-
+def test_MultiMOORA_kracka2010ranking(kracka2010_dm):
     expected = RankResult(
         "MultiMOORA",
-        ["A1", "A2", "A3", "A4", "A5", "A6"],
+        KRACKA2010_ALTERNATIVES,
         [5, 1, 3, 6, 4, 2],
         {
             "rank_matrix": np.transpose(
@@ -304,50 +264,41 @@ def test_MultiMOORA_kracka2010ranking():
                 ]
             ),
             "score": [1, 5, 3, 0, 2, 4],
-            "ratio_score": [
-                -1.62447867,
-                -0.25233889,
-                -0.84635037,
-                -2.23363519,
-                -1.18698242,
-                -0.77456208,
-            ],
-            "refpoint_score": [
-                0.68934931,
-                0.69986697,
-                0.59817104,
-                0.85955696,
-                0.6002238,
-                0.61480595,
-            ],
-            "fmf_score": np.log(
-                [3.4343, 148689.356, 120.3441, 0.7882, 16.2917, 252.9155]
-            ),
-            "reference_point": [
-                0.34587742,
-                0.08556044,
-                0.26245184,
-                0.00011605,
-                0.77343790,
-                0.34960423,
-                0.81382773,
-            ],
+            "ratio_score": KRACKA2010_RATIO_SCORE,
+            "refpoint_score": KRACKA2010_REFPOINT_SCORE,
+            "fmf_score": KRACKA2010_FMF_SCORE,
+            "reference_point": KRACKA2010_REFERENCE_POINT,
         },
     )
 
-    transformer = VectorScaler(target="matrix")
-    dm = transformer.transform(dm)
-
     ranker = MultiMOORA()
-    result = ranker.evaluate(dm)
+    result = ranker.evaluate(kracka2010_dm)
 
     assert result.values_equals(expected)
-    assert np.all(result.e_.rank_matrix == expected.e_.rank_matrix)
-    assert np.allclose(result.e_.score, expected.e_.score)
-    assert np.allclose(result.e_.ratio_score, expected.e_.ratio_score)
-    assert np.allclose(result.e_.refpoint_score, expected.e_.refpoint_score)
-    assert np.allclose(result.e_.fmf_score, expected.e_.fmf_score, atol=1e-4)
-    assert np.allclose(result.e_.reference_point, expected.e_.reference_point)
+    np.testing.assert_array_equal(
+        result.e_.rank_matrix, expected.e_.rank_matrix
+    )
+    np.testing.assert_allclose(
+        result.e_.score, expected.e_.score, rtol=1e-5, atol=1e-8
+    )
+    np.testing.assert_allclose(
+        result.e_.ratio_score, expected.e_.ratio_score, rtol=1e-5, atol=1e-8
+    )
+    np.testing.assert_allclose(
+        result.e_.refpoint_score,
+        expected.e_.refpoint_score,
+        rtol=1e-5,
+        atol=1e-8,
+    )
+    np.testing.assert_allclose(
+        result.e_.fmf_score, expected.e_.fmf_score, rtol=1e-5, atol=1e-4
+    )
+    np.testing.assert_allclose(
+        result.e_.reference_point,
+        expected.e_.reference_point,
+        rtol=1e-5,
+        atol=1e-8,
+    )
 
 
 def test_MultiMOORA_with0_fail():
@@ -357,5 +308,5 @@ def test_MultiMOORA_with0_fail():
     )
 
     ranker = MultiMOORA()
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="values <= 0"):
         ranker.evaluate(dm)
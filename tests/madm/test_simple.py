@@ -186,6 +186,22 @@ def test_WeightedProductModel_with0_fail():
         ranker.evaluate(dm)
 
 
+@pytest.mark.parametrize(
+    "matrix", [[[1, 2, 3], [4, -1, 6]], [[1, np.nan, 3], [4, 0, 6]]]
+)
+def test_WeightedProductModel_negative_fail(matrix):
+
+    dm = skcriteria.mkdm(
+        matrix=matrix,
+        objectives=[max, max, max],
+    )
+
+    ranker = WeightedProductModel()
+
+    with pytest.raises(ValueError, match="values <= 0"):
+        ranker.evaluate(dm)
+
+
 def test_WeightedProductModel_enwiki_1015567716():
     """
     Data from:
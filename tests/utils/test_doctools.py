@@ -67,3 +67,20 @@ def test_doc_inherit():
         @doctools.doc_inherit(doc, warn_class=False)
         class A:  # noqa
             pass
+
+
+def test_doc_inherit_does_not_wrap():
+    def func_a():
+        """Docstring."""
+
+    def func_b():
+        return 42
+
+    code = func_b.__code__
+    decorated = doctools.doc_inherit(func_a)(func_b)
+
+    # only the docstring changes, so the decorated function has no call
+    # overhead
+    assert decorated is func_b
+    assert decorated.__code__ is code
+    assert decorated.__doc__ == func_a.__doc__
@@ -44,6 +44,17 @@ def test_rank_reverse():
     assert np.all(result == expected)
 
 
+def test_rank_ties():
+    values = [0.5, 0.2, 0.5, 0.8, 0.2]
+    expected = [2, 1, 2, 3, 1]
+    result = rank.rank_values(values)
+    assert np.all(result == expected)
+
+    expected = [2, 3, 2, 1, 3]
+    result = rank.rank_values(values, reverse=True)
+    assert np.all(result == expected)
+
+
 @pytest.mark.parametrize(
     "ra, rb",
     [